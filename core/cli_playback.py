@@ -1,16 +1,18 @@
 from textual.app import App, ComposeResult
-from textual.widgets import Header, Footer, Static, Button, Input, ListView, ListItem, Label, ProgressBar
-from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.widgets import Header, Footer, Static, Button, Input, OptionList, Label, ProgressBar
+from textual.widgets.option_list import Option
+from textual.containers import Horizontal, Vertical
 from textual.reactive import reactive
 from textual.message import Message
 from core.dialogs import FolderDialog
 from textual import events
 from textual import worker
 from pathlib import Path
+from array import array
 import asyncio
 
 
-import threading, time, random, os
+import random, os
 import logging
 
 # Set up file logging
@@ -23,10 +25,36 @@ logging.basicConfig(
 
 from .player import VLCMusic
 from .playlist import load_playlist_file, save_playlist_file, scan_folder
-from .common import format_time
+from .common import format_time, prefetch_file
 from .metadata import get_metadata
 from .config import load_config, save_config
 
+# seconds of typing pause before the search filter runs
+SEARCH_DEBOUNCE = 0.15
+# seconds between background flushes of config/playlist changes
+SAVE_INTERVAL = 2.0
+
+class SongEnded(Message):
+    """Posted from VLC's event thread when the current track finishes."""
+
+class PlaybackFailed(Message):
+    """Posted from VLC's event thread when the current media can't be played."""
+
+class ScanProgress(Message):
+    """Posted from the scan thread while tags are being read."""
+    def __init__(self, token, done: int, total: int):
+        self.token = token
+        self.done = done
+        self.total = total
+        super().__init__()
+
+class ScanBatch(Message):
+    """Posted from the scan thread with newly tagged songs, in playlist order."""
+    def __init__(self, token, entries: list):
+        self.token = token
+        self.entries = entries
+        super().__init__()
+
 class SongSelected(Message):
     def __init__(self, index: int):
         self.index = index
@@ -56,20 +84,38 @@ class wavrun(App):
         
         # NEW: Track currently playing song by path instead of index
         self.current_song_path = None
-        self.last_index = self.cfg.get("last_index", 0)
         
         self.playing = False
         self.paused = False
+        self._play_symbol = "▶"  # what btn_play currently shows
 
         self.music_dir = self.cfg.get("music_dir")
-        self.playlist = load_playlist_file()
-        self.full_playlist = self.playlist.copy()  # Keep original playlist
+        self.full_playlist = load_playlist_file()  # Keep original playlist
+        self._search_term = ""
+        self._build_search_index()
+        self._apply_filter("")  # sets self.playlist
         self.shuffle = False
+        # one shuffled pass over _shuffle_source (a playlist list), as paths
+        self._shuffle_order = []
+        self._shuffle_pos = 0
+        self._shuffle_source = None
         self.repeat_mode = "off"  # off|one|all
-        self.song_end_flag = threading.Event()
-        self.progress_updater = None
-        self.stop_threads = False
-        self._lock = threading.Lock()  # Thread safety
+        self.progress_timer = None
+        self.save_timer = None
+        # set when cfg / full_playlist differ from what's on disk
+        self._dirty_cfg = False
+        self._dirty_playlist = False
+        self._save_lock = asyncio.Lock()
+        self._current_len_ms = None  # cached length of the playing track
+        self._length_timer = None
+        # last values shown by _update_progress_ui
+        self._last_pos_s = -1
+        self._last_pct = -1
+        self._last_tick = None  # (pos_ms, len_ms) seen by the previous tick
+        self._search_timer = None  # pending debounced search
+        self._row_options = {}  # path -> Option, one per song in full_playlist
+        self._stream_token = None  # set while a first scan streams rows in
+        self._scan_token = None  # set while any scan runs, see on_scan_progress
 
 
 
@@ -78,25 +124,21 @@ class wavrun(App):
         Returns -1 if not found."""
         if not self.current_song_path:
             return -1
-        for i, song in enumerate(self.playlist):
-            if song["path"] == self.current_song_path:
-                return i
-        return -1
+        return self._path_to_idx.get(self.current_song_path, -1)
     
     def _find_song_in_full_playlist(self, path):
         """Find a song by path in the full playlist. Returns index or -1."""
-        for i, song in enumerate(self.full_playlist):
-            if song["path"] == path:
-                return i
-        return -1
+        return self._path_to_full_idx.get(path, -1)
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
         with Horizontal():
             # left playlist
-            with VerticalScroll(id="playlist_panel"):
-                self.list_view = ListView()
-                yield self.list_view
+            # OptionList only renders the lines in view, so big libraries
+            # don't turn into thousands of widgets
+            with Vertical(id="playlist_panel"):
+                self.song_list = OptionList()
+                yield self.song_list
             # center now playing and controls
             with Vertical(id="now_panel"):
                 self.lbl_title = Label("No song selected", id="title")
@@ -137,139 +179,286 @@ class wavrun(App):
         yield Footer()
 
     async def on_mount(self):
+        # VLC fires its end event on its own thread; post_message is thread
+        # safe, so the callback just hands a SongEnded message to the UI loop.
+        self.player.add_end_callback(lambda: self.post_message(SongEnded()))
+        self.player.add_error_callback(lambda: self.post_message(PlaybackFailed()))
+        self.progress_timer = self.set_interval(0.25, self._tick)
+        self.save_timer = self.set_interval(SAVE_INTERVAL, self._flush_saves)
         if self.music_dir:
             self.status.update("Music folder found")
             if not self.playlist:
-                self.status.update("No playlist")
-                try:
-                    self.playlist = scan_folder(self.music_dir)
-                    self.full_playlist = self.playlist.copy()
-                    self.status.update("Initial scan completed")
-                except Exception as e:
-                    self.status.update("Initial scan failed...")
-                    return
+                self.status.update("No playlist - scanning...")
+                self.run_worker(self._scan_worker(self.music_dir, resume=True), exclusive=True, group="scan")
+            else:
+                # show the cached playlist now, pick up changed files in the background
+                self.run_worker(self._scan_worker(self.music_dir), exclusive=True, group="scan")
         # populate playlist
         self._render_playlist()
-        
-        # resume last index if available - convert to path-based tracking
-        if self.playlist and 0 <= self.last_index < len(self.full_playlist):
-            self.current_song_path = self.full_playlist[self.last_index]["path"]
+        self._resume_last_song()
+
+    def _resume_last_song(self):
+        # resume last index if available - convert to path-based tracking.
+        # self.cfg is the only copy of last_index; _update_cfg writes it back
+        last_index = int(self.cfg.get("last_index", 0))
+        if self.full_playlist and 0 <= last_index < len(self.full_playlist):
+            self.current_song_path = self.full_playlist[last_index]["path"]
             # Highlight it if it's in the current view
-            current_idx = self._get_current_index()
-            if current_idx >= 0:
-                self.list_view.index = current_idx
+            self._highlight_current()
 
-    def _render_playlist(self):
-        self.list_view.clear()
-        for i, item in enumerate(self.playlist):
-            title = item.get("title") or os.path.basename(item["path"])
-            artist = item.get("artist") or "Unknown"
-            label = f"{i + 1:02d}. {title} — {artist}"
-            node = ListItem(Label(label))
-            node.song_index = i
-            node.song = item
-            self.list_view.append(node)
-
-    async def on_list_view_selected(self, message: ListView.Selected):
-        idx = getattr(message.item, "song_index", None)
-        if idx is None:
-            id_str = getattr(message.item, "id", "")
-            try:
-                idx = int(id_str.split("_")[1])
-            except Exception:
+    async def _scan_worker(self, path, resume=False):
+        """Scan path in a thread so the UI keeps running, then swap in the result.
+        Tags are only re-read for files that are new or modified since the last scan.
+        With no playlist to show yet, songs are listed as their tags come in."""
+        scan_token = self._scan_token = object()
+        batch = None
+        if not self.full_playlist:
+            token = self._stream_token = object()
+            batch = lambda entries: self.post_message(ScanBatch(token, entries))
+        try:
+            playlist = await asyncio.to_thread(
+                scan_folder, path, cached=self.full_playlist,
+                progress=lambda done, total: self.post_message(ScanProgress(scan_token, done, total)),
+                batch=batch,
+            )
+        except Exception as e:
+            logging.error(f"Scan of {path} failed: {e}")
+            self.status.update("Scan failed...")
+            return
+        finally:
+            # batches still queued behind us are covered by the full result,
+            # and late progress must not overwrite the final status
+            self._stream_token = None
+            if self._scan_token is scan_token:
+                self._scan_token = None
+        if not playlist and self.full_playlist:
+            # never trade a saved library for an empty scan, the ratings would go with it
+            logging.warning(f"Scan of {path} found no songs; keeping the current playlist")
+            self.status.update("No songs found - playlist kept")
+            return
+        if playlist == self.full_playlist:
+            if batch is None:
+                self.status.update("Playlist up to date")
                 return
-        await self.action_play_index(idx)
+            self.status.update(f"Scan completed: {len(playlist)} songs")
+        else:
+            await self._apply_scanned_playlist(playlist)
+        if resume:
+            self._resume_last_song()
+        await self.action_save()
 
-    async def action_play_index(self, idx:int):
-        # load into VLC and play
-        if idx < 0 or idx >= len(self.playlist):
+    def on_scan_batch(self, message: ScanBatch):
+        if message.token is not self._stream_token:
+            return
+        start = len(self.full_playlist)
+        self.full_playlist = self.full_playlist + message.entries
+        rows = []
+        for i, item in enumerate(message.entries, start):
+            self._search_index.append(self._search_key(item))
+            self._path_to_full_idx[item["path"]] = i
+            rows.append(self._row_options.setdefault(item["path"], self._row_option(i, item)))
+        term = self._search_term
+        if not term:
+            self.playlist = self.full_playlist
+            self.song_list.add_options(rows)
+        else:
+            # only the new songs need checking against the active search
+            words = term.split()
+            index = self._search_index
+            pos = len(self.playlist)
+            matched, shown = [], []
+            for i, item in enumerate(message.entries, start):
+                if all(w in index[i] for w in words):
+                    self._matches.append(i)
+                    self._path_to_idx[item["path"]] = pos + len(matched)
+                    matched.append(item)
+                    shown.append(rows[i - start])
+            # reassigned, not extended: see _apply_filter
+            self.playlist = self.playlist + matched
+            self.song_list.add_options(shown)
+        if self.song_list.highlighted is None and self.playlist:
+            self.song_list.highlighted = 0
+
+    def on_scan_progress(self, message: ScanProgress):
+        if message.token is not self._scan_token:
+            return
+        self.status.update(f"Reading tags {message.done}/{message.total}")
+
+    async def _apply_scanned_playlist(self, playlist):
+        self.full_playlist = playlist
+        self._build_search_index()
+        self._apply_filter(self.search.value)
+        self._render_playlist()
+        self.status.update(f"Scan completed: {len(playlist)} songs")
+
+    def _build_search_index(self):
+        """Precompute one lowercased haystack per song, parallel to full_playlist.
+        Fields are joined with \0 so a term can't match across two fields."""
+        self._search_index = [self._search_key(p) for p in self.full_playlist]
+        self._matches = None  # full_playlist indices matched by the last filter
+        self._path_to_full_idx = {p["path"]: i for i, p in enumerate(self.full_playlist)}
+
+    @staticmethod
+    def _search_key(p):
+        return "\0".join((p.get("title") or "", p.get("artist") or "",
+                          p.get("basename") or os.path.basename(p["path"]))).casefold()
+
+    def _apply_filter(self, term):
+        """Rebuild self.playlist from full_playlist for the given search term."""
+        term = term.strip().casefold()
+        prev = self._search_term
+        self._search_term = term
+        if not term:
+            # Restore full playlist. Shared, not copied: neither list is
+            # mutated in place, they are only ever reassigned
+            self.playlist = self.full_playlist
+            self._matches = None
+            self._path_to_idx = self._path_to_full_idx
             return
-        # Set current song by path, not index
-        self.current_song_path = self.playlist[idx]["path"]
+        # Filter by title, artist or file name
+        index = self._search_index
+        if prev and term.startswith(prev) and self._matches is not None:
+            # the query only grew, so its matches are a subset of the last ones
+            candidates = self._matches
+        else:
+            # _search_index is a column parallel to full_playlist
+            candidates = range(len(index))
+        words = term.split()
+        if len(words) == 1:
+            self._matches = array("i", (i for i in candidates if term in index[i]))
+        else:
+            # every word must match somewhere, in any order ("beatles help")
+            self._matches = array("i", (i for i in candidates if all(w in index[i] for w in words)))
+        full = self.full_playlist
+        self.playlist = [full[i] for i in self._matches]
+        self._path_to_idx = {p["path"]: i for i, p in enumerate(self.playlist)}
+
+    def _render_playlist(self):
+        """Rebuild one row per song in full_playlist. Only needed when
+        full_playlist itself changes; searches reuse the rows, see _show_filtered_rows."""
+        self._row_options = {
+            item["path"]: self._row_option(i, item)
+            for i, item in enumerate(self.full_playlist)
+        }
+        self._show_filtered_rows()
+
+    @staticmethod
+    def _row_option(i, item):
+        # title/artist are filled in at scan time, see playlist._make_entry
+        return Option(f"{i + 1:02d}. {item['title']} — {item['artist']}")
+
+    def _show_filtered_rows(self):
+        """Show the rows of the songs in self.playlist, in order. The list index
+        of a row is the song's index in self.playlist."""
+        rows = self._row_options
+        self.song_list.set_options([rows[p["path"]] for p in self.playlist])
+        self._highlight_current()
+        if self.song_list.highlighted is None and self.playlist:
+            self.song_list.highlighted = 0
+
+    async def on_option_list_option_selected(self, message: OptionList.OptionSelected):
+        await self.action_play_index(message.option_index)
+
+    async def action_play_index(self, idx:int):
+        # load into VLC and play; _play_index checks the bounds
         self._play_index(idx)
 
-    def _play_index(self, idx:int, from_thread=False):
-        """Play song at given index. Thread-safe.
+    def _play_index(self, idx:int):
+        """Play song at given index. Must be called on the UI thread.
         
         Args:
             idx: Index of song to play IN CURRENT PLAYLIST (may be filtered)
-            from_thread: True if called from background thread, False if from UI thread
         """
         if idx < 0 or idx >= len(self.playlist):
             return
-            
-        path = self.playlist[idx]["path"]
+        self._play_path(self.playlist[idx]["path"])
+
+    def _play_path(self, path):
+        """Play the song at path, wherever it sits in full_playlist or the
+        filtered view. Must be called on the UI thread."""
         # Update currently playing song path
         self.current_song_path = path
         
-        logging.debug(f"_play_index called for idx={idx}, path={path}, from_thread={from_thread}")
+        logging.debug(f"_play_path called for path={path}")
         
-        if not os.path.exists(path):
-            if from_thread:
-                self.call_from_thread(lambda: self.status.update("File missing"))
-                self.call_from_thread(self._skip_to_next)
-            else:
-                self.status.update("File missing")
-                asyncio.create_task(self.action_next())
-            return
-            
-        with self._lock:
-            self.player.stop()
-            time.sleep(0.02)
-            self.player.load(path)
-            
-            # Register callback BEFORE playing
-            def on_end():
-                logging.debug("End callback triggered by VLC!")
-                self.song_end_flag.set()
-            
-            self.player.add_end_callback(on_end)
-            logging.debug(f"End callback registered")
-            
-            self.player.play()
-            
-            # Update state
-            self.playing = True
-            self.paused = False
-            
-        # Update UI - use call_from_thread only if we're in a background thread
-        if from_thread:
-            self.call_from_thread(self._update_ui_playing)
-        else:
-            self._update_ui_playing()
+        # no stat here: a missing file surfaces as a VLC error -> on_playback_failed
+        # libvlc_media_player_stop is synchronous, so no settle delay is
+        # needed before swapping media (and sleeping here stalls the UI)
+        self.player.stop()
+        self.player.load(path)
+        self.player.play()
         
-        # start background updater if not running
-        if not self.progress_updater or not self.progress_updater.is_alive():
-            self.progress_updater = threading.Thread(target=self._progress_loop, daemon=True)
-            self.progress_updater.start()
-            logging.debug("Progress updater thread started")
-
-    def _skip_to_next(self):
-        """Called when a file is missing - skip to next song"""
-        asyncio.create_task(self.action_next())
-
-    def _on_song_end(self):
-        self.call_from_thread(self._handle_song_end)
-
-    def _handle_song_end(self):
-        self.song_end_flag.set()
+        # Update state
+        self.playing = True
+        self.paused = False
+        self._dirty_cfg = True  # last_index changed
+        
+        self._resume_progress()
+        # track length doesn't change while it plays - read it once, see _capture_length
+        self._current_len_ms = None
+        self._last_pos_s = self._last_pct = -1
+        self._last_tick = None
+        self.lbl_len.update("??:??")
+        if self._length_timer:
+            self._length_timer.stop()
+        self._length_timer = self.set_timer(0.1, self._capture_length)
+        self._update_ui_playing()
+        # warm up the file that will most likely play after this one
+        next_path = self._peek_next_path()
+        if next_path:
+            self.run_worker(lambda: prefetch_file(next_path), thread=True,
+                            exclusive=True, group="prefetch", exit_on_error=False)
+
+    def _peek_next_path(self):
+        """Path _advance_to_next would pick when this song ends, without
+        consuming anything from the shuffle pass; None if unknown."""
+        if self.shuffle:
+            if (self._shuffle_source is self.full_playlist
+                    and self._shuffle_pos < len(self._shuffle_order)):
+                return self._shuffle_order[self._shuffle_pos]
+            return None
+        idx = self._find_song_in_full_playlist(self.current_song_path)
+        if idx < 0:
+            return None
+        idx += 1
+        if idx >= len(self.full_playlist):
+            if self.repeat_mode != "all":
+                return None
+            idx = 0
+        return self.full_playlist[idx]["path"]
+
+    def _capture_length(self):
+        """Read the track length from VLC once it has parsed the media."""
+        len_ms = self.player.get_length()
+        if len_ms:
+            self._current_len_ms = len_ms
+            self.lbl_len.update(format_time(len_ms/1000.0))
+            self._length_timer = None
+        elif self.playing:
+            # not parsed yet, try again shortly
+            self._length_timer = self.set_timer(0.1, self._capture_length)
 
     async def action_play_pause(self):
         if self.playing:
             self.player.pause()
             self.playing = False
             self.paused = True
-            self.btn_play.label = "▶"
+            self._set_play_button("▶")
         else:
             if not self.current_song_path and self.playlist:
                 # No song playing - start with first song in current playlist
-                self.current_song_path = self.playlist[0]["path"]
                 self._play_index(0)
             else:
                 self.player.unpause()
                 self.playing = True
                 self.paused = False
-                self.btn_play.label = "⏸"
+                self._set_play_button("⏸")
+                self._resume_progress()
+                if self._current_len_ms is None:
+                    # paused before the length was read; _capture_length gave up then
+                    if self._length_timer:
+                        self._length_timer.stop()
+                    self._length_timer = self.set_timer(0.1, self._capture_length)
 
     async def action_next(self):
         if not self.playlist:
@@ -278,20 +467,20 @@ class wavrun(App):
         current_idx = self._get_current_index()
         
         if self.shuffle:
-            idx = random.randrange(len(self.playlist))
-        else:
-            idx = current_idx + 1 if current_idx >= 0 else 0
-            if idx >= len(self.playlist):
-                if self.repeat_mode == "all":
-                    idx = 0
-                else:
-                    # stop
-                    self.player.stop()
-                    self.playing = False
-                    self.btn_play.label = "▶"
-                    return
+            self._play_path(self._next_shuffled(self.playlist))
+            return
+
+        idx = current_idx + 1 if current_idx >= 0 else 0
+        if idx >= len(self.playlist):
+            if self.repeat_mode == "all":
+                idx = 0
+            else:
+                # stop
+                self.player.stop()
+                self.playing = False
+                self._set_play_button("▶")
+                return
         
-        self.current_song_path = self.playlist[idx]["path"]
         self._play_index(idx)
 
     async def action_prev(self):
@@ -307,12 +496,26 @@ class wavrun(App):
             current_idx = 0
             
         idx = current_idx - 1 if current_idx > 0 else (len(self.playlist)-1 if self.repeat_mode=="all" else 0)
-        self.current_song_path = self.playlist[idx]["path"]
         self._play_index(idx)
 
     async def action_shuffle(self):
         self.shuffle = not self.shuffle
         self.btn_shuffle.label = "Shuffle ✓" if self.shuffle else "Shuffle"
+        self._shuffle_source = None  # start a fresh pass from the current song
+
+    def _next_shuffled(self, songs):
+        """Return the next path of a shuffled pass over songs. Every song plays
+        once per pass; the pass is reshuffled when used up or when songs changes."""
+        if self._shuffle_source is not songs or self._shuffle_pos >= len(self._shuffle_order):
+            # the song playing now counts as already played in the new pass
+            order = [p["path"] for p in songs if p["path"] != self.current_song_path]
+            random.shuffle(order)
+            self._shuffle_order = order or [p["path"] for p in songs]
+            self._shuffle_pos = 0
+            self._shuffle_source = songs
+        path = self._shuffle_order[self._shuffle_pos]
+        self._shuffle_pos += 1
+        return path
 
     async def action_repeat(self):
         if self.repeat_mode == "off":
@@ -330,17 +533,16 @@ class wavrun(App):
 
     async def action_clear_search(self):
         """NEW: Clear search and restore full playlist"""
+        self._cancel_pending_search()
         self.search.value = ""
-        self.playlist = self.full_playlist.copy()
-        self._render_playlist()
-        if self.list_view.index is not None:
-            self._highlight_current()
+        self._apply_filter("")
+        self._show_filtered_rows()
 
     async def action_down(self):
-        self.list_view.action_cursor_down()
+        self.song_list.action_cursor_down()
 
     async def action_up(self):
-        self.list_view.action_cursor_up()
+        self.song_list.action_cursor_up()
 
 
 
@@ -356,51 +558,67 @@ class wavrun(App):
         if not path:
             return
         self.music_dir = path
-        try:
-            self.playlist = scan_folder(self.music_dir)
-            self.full_playlist = self.playlist.copy()
-        except Exception as e:
-            return
-        await self.action_save()
         self.current_song_path = None  # Reset currently playing song
-        self._render_playlist()
-        return
+        self._dirty_cfg = True
+        self.status.update("Scanning...")
+        # scan runs in the background; the worker saves and re-renders when done
+        self.run_worker(self._scan_worker(path), exclusive=True, group="scan")
 
     async def action_quit(self):
         await self.action_save_and_exit()
 
     async def action_save_and_exit(self):
-        # Stop threads first
-        self.stop_threads = True
-        if self.progress_updater and self.progress_updater.is_alive():
-            self.progress_updater.join(timeout=1.0)  # Wait for thread to finish
+        # Stop the timers first
+        if self.progress_timer:
+            self.progress_timer.stop()
+        if self.save_timer:
+            self.save_timer.stop()
         
-        # Save current song position by finding it in full playlist
-        if self.current_song_path:
-            idx = self._find_song_in_full_playlist(self.current_song_path)
-            self.cfg["last_index"] = idx if idx >= 0 else 0
-        else:
-            self.cfg["last_index"] = 0
-            
-        self.cfg["music_dir"] = self.music_dir
-        save_config(self.cfg)
-
-        save_playlist_file(self.full_playlist)
-        self.player.stop()
+        # always record the current song on exit
+        self._dirty_cfg = True
+        # the writes and stopping VLC don't depend on each other, overlap them.
+        # Neither may keep us from exiting
+        results = await asyncio.gather(self._flush_saves(), asyncio.to_thread(self.player.stop),
+                                       return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logging.error(f"Error while exiting: {result}")
         self.exit()
 
     async def action_save(self):
+        """Mark config and playlist for the next background flush."""
+        self._dirty_cfg = True
+        self._dirty_playlist = True
+
+    def _update_cfg(self):
         # Save current song position by finding it in full playlist
-        if self.current_song_path:
-            idx = self._find_song_in_full_playlist(self.current_song_path)
-            self.cfg["last_index"] = idx if idx >= 0 else 0
-        else:
-            self.cfg["last_index"] = 0
-            
+        idx = self._find_song_in_full_playlist(self.current_song_path) if self.current_song_path else -1
+        self.cfg["last_index"] = max(idx, 0)
         self.cfg["music_dir"] = self.music_dir
-        save_config(self.cfg)
 
-        save_playlist_file(self.full_playlist)
+    async def _flush_saves(self):
+        """Write whatever changed since the last flush, off the UI thread.
+        Runs every SAVE_INTERVAL seconds so bursts of changes become one write."""
+        async with self._save_lock:
+            writes = []
+            if self._dirty_cfg:
+                self._dirty_cfg = False
+                self._update_cfg()
+                writes.append(self._write_save(save_config, dict(self.cfg), "_dirty_cfg"))
+            if self._dirty_playlist:
+                self._dirty_playlist = False
+                writes.append(self._write_save(save_playlist_file, list(self.full_playlist), "_dirty_playlist"))
+            # separate files, so both can be written at once
+            await asyncio.gather(*writes)
+
+    async def _write_save(self, save, data, dirty_flag):
+        """Run one save in a thread. A failure is logged and the dirty flag set
+        again so the next flush retries; nothing is raised into the timer."""
+        try:
+            await asyncio.to_thread(save, data)
+        except Exception as e:
+            logging.error(f"{save.__name__} failed: {e}")
+            setattr(self, dirty_flag, True)
 
     def _update_ui_playing(self):
         logging.debug(f"_update_ui_playing called, current_song_path: {self.current_song_path}")
@@ -414,7 +632,7 @@ class wavrun(App):
             logging.debug(f"Updating UI with song from current playlist: {item.get('title')}")
             self.lbl_title.update(item.get("title"))
             self.lbl_artist.update(item.get("artist"))
-            self.btn_play.label = "⏸"
+            self._set_play_button("⏸")
             self._highlight_current()
         else:
             # Song not in filtered playlist - show it anyway
@@ -425,70 +643,71 @@ class wavrun(App):
                 logging.debug(f"Updating UI with song from full playlist: {item.get('title')}")
                 self.lbl_title.update(item.get("title") + " (not in filter)")
                 self.lbl_artist.update(item.get("artist"))
-                self.btn_play.label = "⏸"
+                self._set_play_button("⏸")
             else:
                 logging.warning(f"Song not found in either playlist!")
 
+    def _set_play_button(self, symbol):
+        # skip the relabel (and the re-render it causes) if nothing changes
+        if symbol != self._play_symbol:
+            self.btn_play.label = symbol
+            self._play_symbol = symbol
+
     def _highlight_current(self):
         # set list index focus to current song if it's in the filtered playlist
         try:
             current_idx = self._get_current_index()
             if current_idx >= 0:
-                self.list_view.index = current_idx
+                self.song_list.highlighted = current_idx
         except Exception:
             pass
 
-    def _progress_loop(self):
-        """Background thread for updating progress and handling song end events"""
-        logging.debug("Progress loop started")
-        while not self.stop_threads:
-            try:
-                # Update progress if playing
-                if self.playing:
-                    pos_ms = self.player.get_pos()
-                    len_ms = self.player.get_length()
-                    pos_s = (pos_ms/1000.0) if pos_ms else 0.0
-                    len_s = (len_ms/1000.0) if len_ms else None
-                    pct = int((pos_s/len_s)*100) if len_s and len_s>0 else 0
-                    # update UI
-                    self.call_from_thread(lambda: self._update_progress_ui(pos_s, len_s, pct))
-                
-                # FIXED: Check end event and handle song advancement
-                if self.song_end_flag.is_set():
-                    logging.debug("Song end flag detected!")
-                    self.song_end_flag.clear()
-                    
-                    # Handle repeat/shuffle logic
-                    if self.repeat_mode == "one":
-                        logging.debug("Repeat mode ONE - replaying same song")
-                        # Repeat current song - find it in current playlist
-                        current_idx = self._get_current_index()
-                        if current_idx >= 0:
-                            self._play_index(current_idx, from_thread=True)
-                        else:
-                            # Not in filtered playlist, use full playlist
-                            idx_full = self._find_song_in_full_playlist(self.current_song_path)
-                            if idx_full >= 0:
-                                def replay():
-                                    old_pl = self.playlist
-                                    self.playlist = self.full_playlist
-                                    self._play_index(idx_full, from_thread=True)
-                                    self.playlist = old_pl
-                                self.call_from_thread(replay)
-                    else:
-                        logging.debug(f"Advancing to next (shuffle={self.shuffle}, repeat={self.repeat_mode})")
-                        # Advance to next song
-                        self.call_from_thread(self._advance_to_next)
-                        
-                time.sleep(0.2)
-            except Exception as e:
-                # Log errors but keep thread alive
-                logging.exception(f"Progress loop error: {e}")
-                time.sleep(0.5)
-        logging.debug("Progress loop exited")
+    async def _tick(self):
+        """Interval callback for updating progress"""
+        if not self.playing:
+            # nothing to show while paused/stopped; _resume_progress restarts us
+            self.progress_timer.pause()
+            return
+        pos_ms = self.player.get_pos()
+        len_ms = self._current_len_ms
+        if (pos_ms, len_ms) == self._last_tick:
+            return  # stalled (buffering/seek pending): nothing new to draw
+        self._last_tick = (pos_ms, len_ms)
+        pos_s = (pos_ms/1000.0) if pos_ms else 0.0
+        len_s = (len_ms/1000.0) if len_ms else None
+        pct = int((pos_s/len_s)*100) if len_s and len_s>0 else 0
+        self._update_progress_ui(pos_s, len_s, pct)
+
+    def _resume_progress(self):
+        if self.progress_timer:
+            self.progress_timer.resume()
+
+    async def on_playback_failed(self, message: PlaybackFailed):
+        """Skip a track VLC couldn't open; only now is it worth a stat call."""
+        path = self.current_song_path
+        logging.debug(f"Playback failed for {path}")
+        if path and not os.path.exists(path):
+            self.status.update("File missing")
+        else:
+            self.status.update("Playback error")
+        await self.action_next()
+
+    async def on_song_ended(self, message: SongEnded):
+        """Handle the end of a track on the UI thread."""
+        logging.debug("Song ended")
+        # Handle repeat/shuffle logic
+        if self.repeat_mode == "one":
+            logging.debug("Repeat mode ONE - replaying same song")
+            # works whether or not the song is in the filtered view
+            if self._find_song_in_full_playlist(self.current_song_path) >= 0:
+                self._play_path(self.current_song_path)
+        else:
+            logging.debug(f"Advancing to next (shuffle={self.shuffle}, repeat={self.repeat_mode})")
+            # Advance to next song
+            self._advance_to_next()
 
     def _advance_to_next(self):
-        """Advance to next song based on shuffle/repeat settings. Called from thread.
+        """Advance to next song based on shuffle/repeat settings. Called from on_song_ended.
         
         IMPORTANT: When auto-advancing, we use the FULL playlist, not the filtered one.
         This ensures continuous playback even when a search filter is active.
@@ -506,10 +725,9 @@ class wavrun(App):
             return
         
         if self.shuffle:
-            # Random song from FULL playlist
-            next_idx_full = random.randrange(len(self.full_playlist))
-            logging.debug(f"Shuffle mode: selected random index {next_idx_full} from full playlist")
-            next_song_path = self.full_playlist[next_idx_full]["path"]
+            # Next song of the shuffled pass over the FULL playlist
+            next_song_path = self._next_shuffled(self.full_playlist)
+            logging.debug(f"Shuffle mode: selected {next_song_path} from full playlist")
             
         else:
             # Sequential in FULL playlist
@@ -526,46 +744,28 @@ class wavrun(App):
                     # Stop playback
                     logging.debug("End of full playlist - stopping playback")
                     self.player.stop()
-                    with self._lock:
-                        self.playing = False
-                    self.btn_play.label = "▶"  # Already on main thread
+                    self.playing = False
+                    self._set_play_button("▶")
                     return
             else:
                 next_song_path = self.full_playlist[next_idx_full]["path"]
         
-        # Now find this song in the CURRENT (possibly filtered) playlist
-        next_idx_current = -1
-        for i, song in enumerate(self.playlist):
-            if song["path"] == next_song_path:
-                next_idx_current = i
-                break
-        
-        if next_idx_current >= 0:
-            # Song is in current filtered playlist - play it
-            logging.debug(f"Next song found in current playlist at index {next_idx_current}")
-            self.current_song_path = next_song_path
-            # We're already on main thread (via call_from_thread), so from_thread=False
-            self._play_index(next_idx_current, from_thread=False)
-        else:
-            # Song not in filtered playlist - need to play from full playlist
-            logging.debug(f"Next song NOT in filtered playlist - playing from full")
-            self.current_song_path = next_song_path
-            
-            # Temporarily switch to full playlist
-            old_playlist = self.playlist
-            self.playlist = self.full_playlist
-            # We're already on main thread, so from_thread=False
-            self._play_index(next_idx_full, from_thread=False)
-            self.playlist = old_playlist
+        # _play_path doesn't care whether the song is in the filtered view;
+        # _update_ui_playing marks it "(not in filter)" if it isn't
+        self._play_path(next_song_path)
 
     def _update_progress_ui(self, pos_s, len_s, pct):
-        self.lbl_pos.update(format_time(pos_s))
-        if len_s:
-            self.lbl_len.update(format_time(len_s))
+        # lbl_len is set once per track by _capture_length. The label only
+        # shows whole seconds, so skip the redraw until the value changes.
+        pos_int = int(pos_s)
+        if pos_int != self._last_pos_s:
+            self.lbl_pos.update(format_time(pos_int))
+            self._last_pos_s = pos_int
+        if not len_s:
+            pct = 0
+        if pct != self._last_pct:
             self.progress.progress = pct  # FIXED: Set attribute instead of calling update()
-        else:
-            self.lbl_len.update("??:??")
-            self.progress.progress = 0  # FIXED: Set attribute instead of calling update()
+            self._last_pct = pct
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         id = event.button.id
@@ -586,26 +786,34 @@ class wavrun(App):
         if message.input.id != "search":
             return
             
-        term = message.value.strip().lower()
-        if not term:
-            # Restore full playlist
-            self.playlist = self.full_playlist.copy()
-        else:
-            # Filter by title or artist
-            self.playlist = [
-                p for p in self.full_playlist
-                if term in (p.get("title","").lower() + " " +
-                           p.get("artist","").lower() + " " +
-                           os.path.basename(p.get("path","")).lower())
-            ]
-        self._render_playlist()
+        # restart the debounce window on every keystroke
+        self._cancel_pending_search()
+        value = message.value
+        self._search_timer = self.set_timer(SEARCH_DEBOUNCE, lambda: self._apply_search(value))
+
+    def _cancel_pending_search(self):
+        if self._search_timer:
+            self._search_timer.stop()
+        self._search_timer = None
+
+    def _apply_search(self, value):
+        """Filter and re-render once typing has paused for SEARCH_DEBOUNCE seconds."""
+        self._search_timer = None
+        if value.strip().casefold() == self._search_term:
+            return  # e.g. the Changed event from action_clear_search
+        self._apply_filter(value)
+        self._show_filtered_rows()
         self.status.update(f"Found {len(self.playlist)} songs")
 
     async def on_input_submitted(self, message: Input.Submitted) -> None:
         """REMOVED: No longer plays on Enter - just move focus back to list"""
         if message.input.id == "search":
+            # don't make Enter wait out the debounce
+            if self._search_timer:
+                self._cancel_pending_search()
+                self._apply_search(message.value)
             # Move focus to list view
-            self.list_view.focus()
+            self.song_list.focus()
 
     async def on_key(self, event: events.Key) -> None:
         # REMOVED: Enter on list no longer needed since search doesn't submit
@@ -1,31 +1,165 @@
 # core/common.py
+import json
+import os
+import uuid
+from functools import lru_cache
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+# rapidfuzz is imported by the first search that needs a fuzzy fallback,
+# not at start-up, see _fuzzy_index
+HAS_RAPIDFUZZ = None  # None until the import has been tried
+
+# minimum rapidfuzz score (0-100) for a typo-tolerant match
+FUZZY_CUTOFF = 80
+
+@lru_cache(maxsize=4096)
+def _format_seconds(s):
+    # one string per whole second, reused every time the UI shows that second
+    m, s = divmod(s, 60)
+    return f"{m:02d}:{s:02d}"
+
 def format_time(seconds):
     if seconds is None:
         return "??:??"
     try:
-        s = int(seconds)
-        m, s = divmod(s, 60)
-        return f"{m:02d}:{s:02d}"
+        return _format_seconds(int(seconds))
     except Exception:
         return "??:??"
 
-def find_closest_match(song_files, search_term):
-    if not search_term:
-        return None
-    search_term = search_term.lower()
-    best = None
-    best_score = 0.0
-    for s in song_files:
-        lowered = s.lower()
-        if search_term in lowered:
-            score = len(search_term) / max(1, len(lowered))
+# bytes of the next track to pull into the page cache ahead of time
+PREFETCH_BYTES = 128 << 10
+
+def prefetch_file(path, nbytes=PREFETCH_BYTES):
+    """Ask the OS to cache the start of path so opening it later is quick.
+    Best effort: errors are ignored, VLC reports unplayable files itself."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, nbytes, os.POSIX_FADV_WILLNEED)
+        else:
+            os.read(fd, nbytes)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+class SongMatcher:
+    """Casefolded names and word tokens for one song list, kept between
+    find_closest_index queries so typing a term doesn't redo that work per
+    key. The owner builds a new one when the list changes."""
+
+    def __init__(self, song_files):
+        self.song_files = song_files
+        self.lowered = [s.casefold() for s in song_files]
+        self.tokens = [l.replace("_", " ").split() for l in self.lowered]
+        self._term = ""
+        self._hits = None  # indices of the names containing _term
+
+    def find_index(self, search_term):
+        """Index in song_files of the best match for search_term, or -1."""
+        if not search_term:
+            return -1
+        search_term = search_term.casefold()
+        lowered, tokens = self.lowered, self.tokens
+        n = len(search_term)
+        best = -1
+        best_score = 0.0
+        # a token can only start with the term if the name contains it, so the
+        # substring test picks the candidates and only those get token-scored
+        if self._hits is not None and search_term.startswith(self._term):
+            # typing extends the last term, so only its hits can still match
+            hits = [i for i in self._hits if search_term in lowered[i]]
+        else:
+            hits = [i for i, name in enumerate(lowered) if search_term in name]
+        self._term, self._hits = search_term, hits
+        if len(hits) == 1:
+            return hits[0]
+        for i in hits:
+            score = n / max(1, len(lowered[i]))
+            for token in tokens[i]:
+                if token.startswith(search_term):
+                    score = max(score, n / max(1, len(token)))
             if score > best_score:
                 best_score = score
-                best = s
-        for token in lowered.replace("_"," ").split():
-            if token.startswith(search_term):
-                score = len(search_term) / max(1, len(token))
-                if score > best_score:
-                    best_score = score
-                    best = s
-    return best
+                best = i
+        if best < 0:
+            # nothing contains the term as typed; let rapidfuzz forgive typos
+            best = _fuzzy_index(search_term, lowered)
+        return best
+
+def find_closest_index(song_files, search_term):
+    """Index in song_files of the best match for search_term, or -1. For
+    repeated queries against one list, keep a SongMatcher instead."""
+    if not search_term:
+        return -1
+    return SongMatcher(song_files).find_index(search_term)
+
+def _fuzzy_index(search_term, names):
+    """Index of the closest typo-tolerant match in names, or -1 (also when
+    rapidfuzz isn't installed)."""
+    global HAS_RAPIDFUZZ
+    if HAS_RAPIDFUZZ is False:
+        return -1
+    try:
+        from rapidfuzz import fuzz, process as fuzz_process
+    except Exception:
+        HAS_RAPIDFUZZ = False
+        return -1
+    HAS_RAPIDFUZZ = True
+    hit = fuzz_process.extractOne(search_term, names, scorer=fuzz.partial_ratio,
+                                  score_cutoff=FUZZY_CUTOFF)
+    return hit[2] if hit else -1
+
+def find_closest_match(song_files, search_term):
+    i = find_closest_index(song_files, search_term)
+    return song_files[i] if i >= 0 else None
+
+def read_json(path):
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+def dump_json(data, indent=False):
+    """Serialize data to UTF-8 JSON bytes, compact unless indent is set."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def write_json_atomic(path, data, indent=False):
+    """Dump data as JSON next to path, then swap it into place, so a crash or
+    full disk mid-write never leaves a truncated file behind."""
+    payload = dump_json(data, indent)
+    # write through a symlinked file instead of replacing the link itself
+    path = os.path.realpath(os.fspath(path))
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except OSError:
+        mode = None  # new file: 0o666 minus the umask, like open() gives it
+    head, tail = os.path.split(path)
+    tmp = os.path.join(head, f".{tail}.{uuid.uuid4().hex}.tmp")
+    fd = os.open(tmp, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # keep the mode an existing file had
+            if mode is not None and hasattr(os, "fchmod"):
+                os.fchmod(f.fileno(), mode)
+            f.write(payload)
+            # the data must be on disk before the rename makes it the real file
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
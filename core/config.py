@@ -1,23 +1,20 @@
 # core/config.py 
-import json 
 from pathlib import Path
+from .common import read_json, write_json_atomic
 
 CONFIG_FILE = Path("config/config.json")
 
 def load_config():
     if CONFIG_FILE.exists():
         try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return read_json(CONFIG_FILE)
         except Exception:
             print("config file no good.")
             return {}
     return {}
 
-def save_config(new_cfg: dict):
+def save_config(cfg: dict):
+    # the caller's dict is the whole config; no need to re-read and merge
     CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    cfg = load_config()  # always start with existing config
-    cfg.update(new_cfg)   # merge new values
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2)
+    write_json_atomic(CONFIG_FILE, cfg, indent=True)
 
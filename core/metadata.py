@@ -1,28 +1,64 @@
 # core/metadata.py
 import os
-try:
-    from mutagen import File as MutagenFile
-    HAS_MUTAGEN = True
-except Exception:
-    HAS_MUTAGEN = False
+import threading
+
+# mutagen is imported on the first tag read: a start-up whose playlist is
+# up to date reads no tags and shouldn't pay for the import
+HAS_MUTAGEN = None  # None until _load_mutagen has run
+_PARSERS = {}
+_import_lock = threading.Lock()
+
+def _load_mutagen():
+    global HAS_MUTAGEN, MutagenFile
+    with _import_lock:
+        if HAS_MUTAGEN is not None:
+            return HAS_MUTAGEN
+        try:
+            from mutagen import File as MutagenFile
+            from mutagen.easymp4 import EasyMP4
+            from mutagen.flac import FLAC
+            from mutagen.mp3 import EasyMP3
+            from mutagen.oggvorbis import OggVorbis
+            from mutagen.wave import WAVE
+            # the extension almost always names the format, so try that parser
+            # before letting MutagenFile probe every format it knows
+            _PARSERS.update({".mp3": EasyMP3, ".flac": FLAC, ".ogg": OggVorbis,
+                             ".m4a": EasyMP4, ".wav": WAVE})
+            HAS_MUTAGEN = True
+        except Exception:
+            HAS_MUTAGEN = False
+    return HAS_MUTAGEN
+
+def _open_tags(filepath):
+    parser = _PARSERS.get(os.path.splitext(filepath)[1].lower())
+    if parser is not None:
+        try:
+            return parser(filepath)
+        except Exception:
+            pass  # misnamed file (e.g. Opus in .ogg): fall back to probing
+    return MutagenFile(filepath, easy=True)
 
 def get_metadata(filepath):
-    """Return dict {title, artist, length_seconds}"""
+    """Return dict {title, artist, album, length_seconds}"""
     title = os.path.basename(filepath)
     artist = "Unknown"
+    album = ""
     length = None
-    if HAS_MUTAGEN:
+    if HAS_MUTAGEN or _load_mutagen():
         try:
-            audio = MutagenFile(filepath, easy=True)
+            audio = _open_tags(filepath)
             if audio:
                 t = audio.get("title") or audio.get("TIT2") or audio.get("TITLE")
                 a = audio.get("artist") or audio.get("TPE1") or audio.get("ARTIST")
+                al = audio.get("album") or audio.get("TALB") or audio.get("ALBUM")
                 if t:
                     title = t[0] if isinstance(t, (list,tuple)) else str(t)
                 if a:
                     artist = a[0] if isinstance(a, (list,tuple)) else str(a)
+                if al:
+                    album = al[0] if isinstance(al, (list,tuple)) else str(al)
                 if hasattr(audio, "info") and getattr(audio.info, "length", None):
                     length = float(audio.info.length)
         except Exception:
             pass
-    return {"title": title, "artist": artist, "length": length}
+    return {"title": title, "artist": artist, "album": album, "length": length}
@@ -1,6 +1,5 @@
 # core/player.py - DEBUG VERSION
 import vlc
-import time
 import threading
 import logging
 
@@ -11,6 +10,8 @@ class VLCMusic:
         self.player = self.instance.media_player_new()
         self.current_media = None
         self._end_callback = None
+        self._error_callback = None
+        self._pos_ms = 0  # kept current by MediaPlayerTimeChanged
         self._events_attached = False
         self.set_volume(0.7)
         
@@ -18,6 +19,8 @@ class VLCMusic:
         try:
             em = self.player.event_manager()
             em.event_attach(vlc.EventType.MediaPlayerEndReached, self._vlc_end_event)
+            em.event_attach(vlc.EventType.MediaPlayerEncounteredError, self._vlc_error_event)
+            em.event_attach(vlc.EventType.MediaPlayerTimeChanged, self._vlc_time_event)
             self._events_attached = True
             logging.debug("VLC: End event handler attached successfully")
         except Exception as e:
@@ -28,11 +31,13 @@ class VLCMusic:
         media = self.instance.media_new(str(filepath))
         self.player.set_media(media)
         self.current_media = media
+        self._pos_ms = 0
         logging.debug(f"VLC: Loaded media: {filepath}")
     
     def play(self):
+        # play() is asynchronous in libvlc; no need to wait for it here, the
+        # app polls get_length/get_pos on timers anyway
         self.player.play()
-        time.sleep(0.05)
         logging.debug("VLC: Started playback")
     
     def pause(self):
@@ -47,6 +52,7 @@ class VLCMusic:
     def stop(self):
         try:
             self.player.stop()
+            self._pos_ms = 0
             logging.debug("VLC: Stopped")
         except Exception as e:
             logging.error(f"VLC: Error stopping: {e}")
@@ -66,6 +72,9 @@ class VLCMusic:
             return False
     
     def get_pos(self):
+        if self._events_attached:
+            # no libvlc call: the time event thread keeps _pos_ms up to date
+            return max(0, self._pos_ms)
         return max(0, self.player.get_time())
     
     def get_length(self):
@@ -75,6 +84,7 @@ class VLCMusic:
     def set_time(self, ms):
         try:
             self.player.set_time(int(ms))
+            self._pos_ms = int(ms)
         except Exception:
             pass
     
@@ -83,6 +93,24 @@ class VLCMusic:
         self._end_callback = callback
         logging.debug(f"VLC: End callback registered")
     
+    def add_error_callback(self, callback):
+        """Register a callback to be called when VLC fails to play the media"""
+        self._error_callback = callback
+        logging.debug("VLC: Error callback registered")
+    
+    def _vlc_error_event(self, event):
+        """Called by VLC event thread when the media can't be opened or decoded"""
+        logging.debug("VLC: MediaPlayerEncounteredError event fired!")
+        if callable(self._error_callback):
+            try:
+                self._error_callback()
+            except Exception as e:
+                logging.error(f"VLC: Error in error callback: {e}")
+    
+    def _vlc_time_event(self, event):
+        """Called by VLC event thread as playback time advances"""
+        self._pos_ms = event.u.new_time
+    
     def _vlc_end_event(self, event):
         """Called by VLC event thread when media ends"""
         logging.debug("VLC: MediaPlayerEndReached event fired!")
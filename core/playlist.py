@@ -1,22 +1,119 @@
 # core/playlist.py
 import os
-import json
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from .metadata import get_metadata
+from .common import read_json, write_json_atomic
 
 PLAYLIST_FILE = Path("config/playlist.json")
+AUDIO_EXTS = (".mp3", ".flac", ".wav", ".ogg", ".m4a")
+# tag reads mostly wait on disk, so use more threads than cores
+METADATA_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+PROGRESS_EVERY = 64
+# directory listings are pure I/O wait as well
+SCAN_WORKERS = 8
 
-def scan_folder(folder, exts=None):
+def _list_audio_dir(path, exts):
+    """Return ([(path, mtime, size), ...], [subdir, ...]) for one directory,
+    both in name order. os.scandir hands back the stat result with the
+    directory entry, so this costs one syscall per file."""
+    files, subdirs = [], []
+    try:
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return files, subdirs
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.lower().endswith(exts):
+                st = entry.stat()
+                files.append((entry.path, st.st_mtime, st.st_size))
+        except OSError:
+            continue
+    return files, subdirs
+
+def _walk_audio_files(folder, exts):
+    """Yield (path, mtime, size) for every audio file under folder, in os.walk's
+    top-down order. Directories are listed in a thread pool as soon as they're
+    found, which hides per-directory latency on network or fuse mounts."""
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as ex:
+        pending = {folder: ex.submit(_list_audio_dir, folder, exts)}
+        stack = [folder]
+        while stack:
+            files, subdirs = pending.pop(stack.pop()).result()
+            for d in subdirs:
+                pending[d] = ex.submit(_list_audio_dir, d, exts)
+            yield from files
+            # first subdir is visited first
+            stack.extend(reversed(subdirs))
+
+def _make_entry(path, mtime, size, meta, rating=0):
+    basename = os.path.basename(path)
+    return {
+        "path": path,
+        "basename": basename,
+        "title": meta["title"] or basename,
+        "artist": meta["artist"] or "Unknown",
+        "album": meta.get("album", ""),
+        "length": meta.get("length"),
+        "mtime": mtime,
+        "size": size,
+        "rating": rating,
+    }
+
+def scan_folder(folder, exts=None, cached=None, progress=None, batch=None):
+    """Scan folder for audio files and return playlist entries.
+
+    Entries from `cached` (a previously saved playlist) are reused verbatim
+    when the file's mtime and size are unchanged; only new or modified files have
+    their tags re-read. `progress(done, total)` is called every few files
+    while tags are being read, and `batch(entries)` with the next finished
+    run of entries, in playlist order, so a caller can show them early."""
     if exts is None:
-        exts = (".mp3", ".flac", ".wav", ".ogg", ".m4a")
+        exts = AUDIO_EXTS
+    # raise if the folder itself can't be listed (missing, unmounted drive):
+    # an empty result would look like every song had been deleted
+    with os.scandir(folder):
+        pass
+    by_path = {e["path"]: e for e in (cached or []) if "path" in e}
+
     song_files = []
-    for root, dirs, files in os.walk(folder):
-        for fn in files:
-            if fn.lower().endswith(exts):
-                path = os.path.join(root, fn)
-                meta = get_metadata(path)
-                entry = {"path": path, "title": meta["title"], "artist": meta["artist"], "rating": 0}
-                song_files.append(entry)
+    to_fetch = []  # (position in song_files, path, mtime, size)
+    for path, mtime, size in _walk_audio_files(folder, exts):
+        old = by_path.get(path)
+        if old is not None and old.get("mtime") == mtime and old.get("size") == size:
+            song_files.append(old)
+        else:
+            song_files.append(None)
+            to_fetch.append((len(song_files) - 1, path, mtime, size))
+
+    ready = 0  # song_files[:ready] is complete and has been handed to batch
+
+    def flush():
+        nonlocal ready
+        end = ready
+        while end < len(song_files) and song_files[end] is not None:
+            end += 1
+        if batch and end > ready:
+            batch(song_files[ready:end])
+        ready = end
+
+    if to_fetch:
+        # tag reads are blocking file I/O, so overlap them in a thread pool
+        total = len(to_fetch)
+        with ThreadPoolExecutor(max_workers=METADATA_WORKERS) as ex:
+            metas = ex.map(get_metadata, [path for _, path, _, _ in to_fetch])
+            for done, ((pos, path, mtime, size), meta) in enumerate(zip(to_fetch, metas), 1):
+                old = by_path.get(path)
+                rating = old.get("rating", 0) if old else 0
+                song_files[pos] = _make_entry(path, mtime, size, meta, rating)
+                if done % PROGRESS_EVERY == 0 or done == total:
+                    flush()
+                    if progress:
+                        progress(done, total)
+    flush()
 
     #song_files.sort()
     return song_files
@@ -25,21 +122,24 @@ def make_playlist_from_paths(paths):
     pl = []
     for p in paths:
         meta = get_metadata(p)
-        pl.append({"path": p, "title": meta["title"], "artist": meta["artist"], "rating": 0})
+        try:
+            st = os.stat(p)
+            mtime, size = st.st_mtime, st.st_size
+        except OSError:
+            mtime = size = None
+        pl.append(_make_entry(p, mtime, size, meta))
     return pl
 
 def load_playlist_file():
     if PLAYLIST_FILE.exists():
         try:
-            with open(PLAYLIST_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return read_json(PLAYLIST_FILE)
         except Exception:
             return []
     return []
 
 def save_playlist_file(playlist):
-    try:
-        with open(PLAYLIST_FILE, "w", encoding="utf-8") as f:
-            json.dump(playlist, f, indent=2)
-    except Exception:
-        pass
+    # errors propagate: the app logs them and retries on its next flush
+    PLAYLIST_FILE.parent.mkdir(parents=True, exist_ok=True)
+    # compact: this file can hold thousands of entries and is rewritten on change
+    write_json_atomic(PLAYLIST_FILE, playlist)